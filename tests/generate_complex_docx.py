@@ -11,9 +11,13 @@ Each .docx is a ZIP archive with minimal OOXML structure:
   word/_rels/document.xml.rels
 """
 
+import concurrent.futures
+import functools
+import io
 import os
+import time
 import zipfile
-import xml.sax.saxutils as saxutils
+import zlib
 
 # ---------------------------------------------------------------------------
 # Shared OOXML boilerplate
@@ -28,7 +32,7 @@ CONTENT_TYPES = """\
     ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
   <Override PartName="/word/numbering.xml"
     ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>
-</Types>"""
+</Types>""".encode("utf-8")
 
 CONTENT_TYPES_NO_NUMBERING = """\
 <?xml version="1.0" encoding="UTF-8" standalone="yes"?>
@@ -37,7 +41,7 @@ CONTENT_TYPES_NO_NUMBERING = """\
   <Default Extension="xml" ContentType="application/xml"/>
   <Override PartName="/word/document.xml"
     ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
-</Types>"""
+</Types>""".encode("utf-8")
 
 RELS = """\
 <?xml version="1.0" encoding="UTF-8" standalone="yes"?>
@@ -45,12 +49,12 @@ RELS = """\
   <Relationship Id="rId1"
     Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
     Target="word/document.xml"/>
-</Relationships>"""
+</Relationships>""".encode("utf-8")
 
 DOC_RELS = """\
 <?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-</Relationships>"""
+</Relationships>""".encode("utf-8")
 
 DOC_RELS_WITH_NUMBERING = """\
 <?xml version="1.0" encoding="UTF-8" standalone="yes"?>
@@ -58,7 +62,7 @@ DOC_RELS_WITH_NUMBERING = """\
   <Relationship Id="rId1"
     Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering"
     Target="numbering.xml"/>
-</Relationships>"""
+</Relationships>""".encode("utf-8")
 
 SECT_PR = """\
     <w:sectPr>
@@ -87,108 +91,270 @@ NUMBERING_XML = """\
   <w:num w:numId="1">
     <w:abstractNumId w:val="0"/>
   </w:num>
-</w:numbering>"""
+</w:numbering>""".encode("utf-8")
 
 
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
 def esc(text):
-    """Escape text for XML content."""
-    return saxutils.escape(text)
+    """Escape text for XML content.
 
+    Almost all strings fed through here (lorem text, labels, font names)
+    contain none of & < >, so check first and return them unchanged;
+    anything else is escaped in a single translate pass instead of the
+    three chained replaces saxutils.escape would make.
+    """
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return text.translate(_XML_ESCAPE)
 
-def make_run(text, font=None, size=None, bold=False, italic=False,
-             underline=False, strike=False, color=None):
-    """Build a <w:r> element with optional formatting."""
-    rpr_parts = []
+
+# Only ~15 distinct formatting combinations are ever requested across the
+# generators, so a specialised run builder is generated per combination
+# (see _make_run_builder) with its finished rPr baked in as a literal.
+_RUN_BUILDERS = {}
+
+# The same handful of font names recurs across formatting combinations;
+# escape and format each <w:rFonts> fragment only once.
+_RFONTS_CACHE = {}
+
+
+def _build_rpr(font, size, bold, italic, underline, strike, color):
+    """Build the <w:rPr> block for a formatting combination ("" if plain)."""
+    if not (font or size or bold or italic or underline or strike or color):
+        return ""
+    parts = ["<w:rPr>"]
     if font:
-        rpr_parts.append(
-            f'<w:rFonts w:ascii="{esc(font)}" w:hAnsi="{esc(font)}" '
-            f'w:cs="{esc(font)}"/>'
-        )
+        rfonts = _RFONTS_CACHE.get(font)
+        if rfonts is None:
+            ef = esc(font)
+            rfonts = _RFONTS_CACHE[font] = (
+                f'<w:rFonts w:ascii="{ef}" w:hAnsi="{ef}" w:cs="{ef}"/>'
+            )
+        parts.append(rfonts)
     if bold:
-        rpr_parts.append("<w:b/>")
+        parts.append("<w:b/>")
     if italic:
-        rpr_parts.append("<w:i/>")
+        parts.append("<w:i/>")
     if underline:
-        rpr_parts.append('<w:u w:val="single"/>')
+        parts.append('<w:u w:val="single"/>')
     if strike:
-        rpr_parts.append("<w:strike/>")
+        parts.append("<w:strike/>")
     if size:
         half_pts = size * 2
-        rpr_parts.append(f'<w:sz w:val="{half_pts}"/>')
-        rpr_parts.append(f'<w:szCs w:val="{half_pts}"/>')
+        parts.append(f'<w:sz w:val="{half_pts}"/>')
+        parts.append(f'<w:szCs w:val="{half_pts}"/>')
     if color:
-        rpr_parts.append(f'<w:color w:val="{color}"/>')
+        parts.append(f'<w:color w:val="{color}"/>')
+    parts.append("</w:rPr>")
+    return "".join(parts)
+
 
-    rpr = ""
-    if rpr_parts:
-        rpr = "<w:rPr>" + "".join(rpr_parts) + "</w:rPr>"
+def _esc_all(texts):
+    """Escape a list of text strings once, up front."""
+    return [esc(t) for t in texts]
 
-    return (
-        f"<w:r>{rpr}"
-        f'<w:t xml:space="preserve">{esc(text)}</w:t>'
-        f"</w:r>"
+
+def _make_run_builder(key):
+    """Generate a run builder specialised for one formatting signature.
+
+    The rPr block is constant per signature, so exec a tiny function
+    whose code object carries the surrounding XML as a string literal;
+    calling it is one concatenation with no branches or formatting.
+    """
+    prefix = f'<w:r>{_build_rpr(*key)}<w:t xml:space="preserve">'
+    namespace = {}
+    exec(
+        f"def build(text):\n    return {prefix!r} + text + '</w:t></w:r>'",
+        namespace,
     )
+    builder = _RUN_BUILDERS[key] = namespace["build"]
+    return builder
+
+
+@functools.lru_cache(maxsize=4096)
+def make_run(text, font=None, size=None, bold=False, italic=False,
+             underline=False, strike=False, color=None, pre_escaped=False):
+    """Build a <w:r> element with optional formatting.
+
+    Memoized: the generators re-render the same (text, formatting) pairs
+    many times (lorem paragraphs, bullet markers, labels), so repeats
+    become a cache lookup instead of a rebuild. Callers that batch-escape
+    their text with _esc_all pass pre_escaped=True to skip esc here.
+    """
+    key = (font, size, bold, italic, underline, strike, color)
+    builder = _RUN_BUILDERS.get(key)
+    if builder is None:
+        builder = _make_run_builder(key)
+    if not pre_escaped:
+        text = esc(text)
+    return builder(text)
 
 
 def make_para(runs, align=None, style=None, indent_left=None,
               num_id=None, ilvl=None, spacing_after=None):
     """Build a <w:p> element from one or more runs (strings)."""
-    ppr_parts = []
+    if not isinstance(runs, str):
+        runs = tuple(runs)
+    return _make_para(runs, align, style, indent_left, num_id, ilvl,
+                      spacing_after)
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_para(runs, align, style, indent_left, num_id, ilvl, spacing_after):
+    """Memoized body of make_para; `runs` is a str or tuple of run XML."""
+    parts = ["<w:p>"]
+    has_ppr = (style or align or indent_left or spacing_after is not None
+               or (num_id is not None and ilvl is not None))
+    if has_ppr:
+        parts.append("<w:pPr>")
     if style:
-        ppr_parts.append(f'<w:pStyle w:val="{style}"/>')
+        parts.append(f'<w:pStyle w:val="{style}"/>')
     if align:
-        ppr_parts.append(f'<w:jc w:val="{align}"/>')
+        parts.append(f'<w:jc w:val="{align}"/>')
     if indent_left:
-        ppr_parts.append(f'<w:ind w:left="{indent_left}"/>')
+        parts.append(f'<w:ind w:left="{indent_left}"/>')
     if num_id is not None and ilvl is not None:
-        ppr_parts.append(
+        parts.append(
             f"<w:numPr>"
             f'<w:ilvl w:val="{ilvl}"/>'
             f'<w:numId w:val="{num_id}"/>'
             f"</w:numPr>"
         )
     if spacing_after is not None:
-        ppr_parts.append(f'<w:spacing w:after="{spacing_after}"/>')
-
-    ppr = ""
-    if ppr_parts:
-        ppr = "<w:pPr>" + "".join(ppr_parts) + "</w:pPr>"
+        parts.append(f'<w:spacing w:after="{spacing_after}"/>')
+    if has_ppr:
+        parts.append("</w:pPr>")
 
     if isinstance(runs, str):
-        runs = [runs]
+        parts.append(runs)
+    else:
+        parts.extend(runs)
+    parts.append("</w:p>")
+    return "".join(parts)
+
+
+def add_para(buf, para):
+    """Write a paragraph plus its newline separator into a body buffer."""
+    buf.write(para)
+    buf.write("\n")
+
 
-    return "<w:p>" + ppr + "".join(runs) + "</w:p>"
+def add_paras(buf, paras):
+    """Write a batch of paragraphs; writelines drives the loop in C."""
+    buf.writelines(p + "\n" for p in paras)
 
 
-def wrap_document(body_xml):
-    """Wrap body paragraphs in a complete document.xml."""
-    return (
+def wrap_document(body):
+    """Yield the fragments of a complete document.xml.
+
+    `body` is either an io.StringIO buffer in which every paragraph is
+    already followed by a newline (see add_para), or a lazy iterable of
+    paragraph strings. Yielding fragments instead of one concatenated
+    string lets write_docx stream them into the archive without ever
+    materialising the whole document.
+    """
+    yield (
         '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
         f"<w:document {W_NS} {R_NS}>\n"
-        f"  <w:body>\n{body_xml}\n{SECT_PR}\n  </w:body>\n"
-        f"</w:document>"
+        "  <w:body>\n"
     )
-
-
-def write_docx(path, document_xml, include_numbering=False):
-    """Write a .docx ZIP archive."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+    if isinstance(body, io.StringIO):
+        yield body.getvalue()
+    else:
+        for para in body:
+            yield para
+            yield "\n"
+    yield f"{SECT_PR}\n  </w:body>\n</w:document>"
+
+
+@functools.lru_cache(maxsize=None)
+def _precompress(data):
+    """Deflate an immutable member and CRC it, once per process."""
+    comp = zlib.compressobj(1, zlib.DEFLATED, -15)
+    return zlib.crc32(data) & 0xFFFFFFFF, comp.compress(data) + comp.flush()
+
+
+def _write_precompressed(zf, name, data):
+    """Append a boilerplate member from its cached deflate stream.
+
+    The boilerplate parts are byte-for-byte identical across all five
+    fixtures and every run, yet writestr would CRC and deflate them again
+    for each archive. zipfile has no public API for adding already
+    compressed data, so this writes the local header and raw deflate
+    bytes directly, maintaining the same bookkeeping writestr does.
+    """
+    crc, cdata = _precompress(data)
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.external_attr = 0o600 << 16  # rw------- like writestr
+    zinfo.CRC = crc
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(cdata)
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader(False))
+    zf.fp.write(cdata)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
+
+@functools.lru_cache(maxsize=2)
+def _template_archive(include_numbering):
+    """Serialized archive holding only the boilerplate members.
+
+    The four (or five) fixed members are identical across fixtures, so
+    the archive prefix containing them is built once per variant; each
+    write_docx call copies these bytes and appends just document.xml.
+    """
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
         if include_numbering:
-            zf.writestr("[Content_Types].xml", CONTENT_TYPES)
-            zf.writestr("word/_rels/document.xml.rels", DOC_RELS_WITH_NUMBERING)
-            zf.writestr("word/numbering.xml", NUMBERING_XML)
+            _write_precompressed(zf, "[Content_Types].xml", CONTENT_TYPES)
+            _write_precompressed(zf, "word/_rels/document.xml.rels",
+                                 DOC_RELS_WITH_NUMBERING)
+            _write_precompressed(zf, "word/numbering.xml", NUMBERING_XML)
         else:
-            zf.writestr("[Content_Types].xml", CONTENT_TYPES_NO_NUMBERING)
-            zf.writestr("word/_rels/document.xml.rels", DOC_RELS)
-        zf.writestr("_rels/.rels", RELS)
-        zf.writestr("word/document.xml", document_xml)
-    size = os.path.getsize(path)
-    print(f"  Created {os.path.basename(path)} ({size:,} bytes)")
+            _write_precompressed(zf, "[Content_Types].xml",
+                                 CONTENT_TYPES_NO_NUMBERING)
+            _write_precompressed(zf, "word/_rels/document.xml.rels", DOC_RELS)
+        _write_precompressed(zf, "_rels/.rels", RELS)
+    return buf.getvalue()
+
+
+def write_docx(path, document_parts, include_numbering=False):
+    """Write a .docx ZIP archive.
+
+    `document_parts` is an iterable of document.xml fragments (as
+    produced by wrap_document); they are deflated straight into the
+    archive so the full document string never exists in memory.
+    """
+    if isinstance(document_parts, str):
+        document_parts = (document_parts,)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_template_archive(include_numbering))
+    # These are regenerated test fixtures, not distribution artifacts:
+    # level-1 deflate is several times faster than the default for this
+    # highly compressible XML at a modest size penalty.
+    with zipfile.ZipFile(path, "a", zipfile.ZIP_DEFLATED,
+                         compresslevel=1) as zf:
+        zinfo = zipfile.ZipInfo("word/document.xml",
+                                date_time=time.localtime()[:6])
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo._compresslevel = 1  # ZipFile.open ignores the archive default
+        with zf.open(zinfo, "w") as member:
+            for fragment in document_parts:
+                member.write(fragment.encode("utf-8"))
+    return os.path.getsize(path)
 
 
 # ---------------------------------------------------------------------------
@@ -225,14 +391,14 @@ def generate_multi_font():
          False, 12),
     ]
 
-    paras = []
-    paras.append(make_para(
+    buf = io.StringIO()
+    add_para(buf, make_para(
         make_run("Multi-Font Test Document", font="Arial Black", size=28,
                  bold=True),
         align="center",
         spacing_after="400",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run(
             "This document tests rendering of multiple fonts. Each paragraph "
             "below identifies which font it uses.",
@@ -241,13 +407,20 @@ def generate_multi_font():
         spacing_after="200",
     ))
 
-    for font_name, text, bold, size in fonts:
-        label = make_run(f"[Font: {font_name}] ", font=font_name, size=size,
-                         bold=True, color="333399")
-        content = make_run(text, font=font_name, size=size, bold=bold)
-        paras.append(make_para([label, content], spacing_after="200"))
+    # One label per font, built (and escaped, via make_run's cache) once
+    # even when a font recurs.
+    labels = {font_name: f"[Font: {font_name}] "
+              for font_name, _, _, _ in fonts}
+    add_paras(buf, (
+        make_para([
+            make_run(labels[font_name], font=font_name, size=size,
+                     bold=True, color="333399"),
+            make_run(text, font=font_name, size=size, bold=bold),
+        ], spacing_after="200")
+        for font_name, text, bold, size in fonts
+    ))
 
-    return wrap_document("\n".join(paras))
+    return wrap_document(buf)
 
 
 # ---------------------------------------------------------------------------
@@ -262,13 +435,13 @@ def generate_missing_fonts():
         "UnicornTypeFace",
     ]
 
-    paras = []
-    paras.append(make_para(
+    buf = io.StringIO()
+    add_para(buf, make_para(
         make_run("Missing Font Test Document", size=28, bold=True),
         align="center",
         spacing_after="400",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run(
             "This document uses fonts that do not exist on any standard "
             "system. The PDF converter should emit font warnings and fall "
@@ -279,10 +452,11 @@ def generate_missing_fonts():
         spacing_after="200",
     ))
 
-    for font_name in missing_fonts:
-        paras.append(make_para(
+    labels = {font_name: f"[Font: {font_name}] " for font_name in missing_fonts}
+    add_paras(buf, (
+        make_para(
             [
-                make_run(f"[Font: {font_name}] ", font=font_name, size=14,
+                make_run(labels[font_name], font=font_name, size=14,
                          bold=True, color="CC0000"),
                 make_run(
                     f"This paragraph is set in \"{font_name}\". If you see "
@@ -292,10 +466,12 @@ def generate_missing_fonts():
                 ),
             ],
             spacing_after="200",
-        ))
+        )
+        for font_name in missing_fonts
+    ))
 
     # Baseline paragraph in Arial
-    paras.append(make_para(
+    add_para(buf, make_para(
         [
             make_run("[Font: Arial - BASELINE] ", font="Arial", size=14,
                      bold=True, color="006600"),
@@ -310,7 +486,7 @@ def generate_missing_fonts():
         spacing_after="200",
     ))
 
-    return wrap_document("\n".join(paras))
+    return wrap_document(buf)
 
 
 # ---------------------------------------------------------------------------
@@ -318,31 +494,31 @@ def generate_missing_fonts():
 # ---------------------------------------------------------------------------
 
 def generate_rich_formatting():
-    paras = []
+    buf = io.StringIO()
 
     # Heading 1
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Heading Level 1: Rich Formatting Test", size=28, bold=True),
         style="Heading1",
         spacing_after="200",
     ))
 
     # Heading 2
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Heading Level 2: Text Styles", size=22, bold=True),
         style="Heading2",
         spacing_after="160",
     ))
 
     # Heading 3
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Heading Level 3: Inline Formatting", size=18, bold=True),
         style="Heading3",
         spacing_after="120",
     ))
 
     # Bold, italic, underline, strikethrough
-    paras.append(make_para([
+    add_para(buf, make_para([
         make_run("Bold text. ", bold=True, size=12),
         make_run("Italic text. ", italic=True, size=12),
         make_run("Underlined text. ", underline=True, size=12),
@@ -352,18 +528,20 @@ def generate_rich_formatting():
     ], spacing_after="120"))
 
     # Font sizes
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Font Size Variations:", size=12, bold=True),
         spacing_after="60",
     ))
-    for pt in [8, 12, 18, 24, 36]:
-        paras.append(make_para(
+    add_paras(buf, (
+        make_para(
             make_run(f"This text is {pt}pt", size=pt),
             spacing_after="60",
-        ))
+        )
+        for pt in [8, 12, 18, 24, 36]
+    ))
 
     # Colors
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Color Variations:", size=12, bold=True),
         spacing_after="60",
     ))
@@ -375,41 +553,41 @@ def generate_rich_formatting():
         ("FF8C00", "Dark Orange"),
         ("800080", "Purple"),
     ]
-    paras.append(make_para(
+    add_para(buf, make_para(
         [make_run(f"{name} ", size=14, color=code, bold=True)
          for code, name in colors],
         spacing_after="120",
     ))
 
     # Alignment
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Heading Level 2: Alignment", size=22, bold=True),
         style="Heading2",
         spacing_after="160",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("This paragraph is left-aligned (default).", size=12),
         align="left",
         spacing_after="60",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("This paragraph is center-aligned.", size=12),
         align="center",
         spacing_after="60",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("This paragraph is right-aligned.", size=12),
         align="right",
         spacing_after="60",
     ))
 
     # Bulleted list (using Unicode bullet + indent)
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Heading Level 2: Lists", size=22, bold=True),
         style="Heading2",
         spacing_after="160",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Bulleted list:", size=12, bold=True),
         spacing_after="60",
     ))
@@ -420,15 +598,17 @@ def generate_rich_formatting():
         "Third bullet item",
         "Fourth bullet item",
     ]
-    for item in bullets:
-        paras.append(make_para(
+    add_paras(buf, (
+        make_para(
             make_run(f"\u2022 {item}", size=12),
             indent_left="720",
             spacing_after="40",
-        ))
+        )
+        for item in bullets
+    ))
 
     # Numbered list (using numbering.xml reference)
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Numbered list:", size=12, bold=True),
         spacing_after="60",
     ))
@@ -439,20 +619,22 @@ def generate_rich_formatting():
         "lists also handle line wrapping correctly",
         "Fourth numbered item",
     ]
-    for item in numbered_items:
-        paras.append(make_para(
+    add_paras(buf, (
+        make_para(
             make_run(item, size=12),
             num_id=1, ilvl=0,
             spacing_after="40",
-        ))
+        )
+        for item in numbered_items
+    ))
 
     # Combined formatting
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Heading Level 2: Combined Formatting", size=22, bold=True),
         style="Heading2",
         spacing_after="160",
     ))
-    paras.append(make_para([
+    add_para(buf, make_para([
         make_run("Large ", font="Georgia", size=24, bold=True, color="FF0000"),
         make_run("bold red Georgia", font="Georgia", size=24, bold=True,
                  color="FF0000"),
@@ -462,7 +644,7 @@ def generate_rich_formatting():
         make_run(" in a single paragraph.", size=12),
     ], spacing_after="120"))
 
-    return wrap_document("\n".join(paras))
+    return wrap_document(buf)
 
 
 # ---------------------------------------------------------------------------
@@ -470,9 +652,9 @@ def generate_rich_formatting():
 # ---------------------------------------------------------------------------
 
 def generate_unicode_text():
-    paras = []
+    buf = io.StringIO()
 
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("Unicode and International Text Test", size=28, bold=True),
         align="center",
         spacing_after="400",
@@ -518,21 +700,21 @@ def generate_unicode_text():
     ]
 
     for label, text in sections:
-        paras.append(make_para(
+        add_para(buf, make_para(
             make_run(f"[{label}]", size=11, bold=True, color="333399"),
             spacing_after="40",
         ))
-        paras.append(make_para(
+        add_para(buf, make_para(
             make_run(text, size=12),
             spacing_after="200",
         ))
 
     # Symbols
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("[Common Symbols]", size=11, bold=True, color="333399"),
         spacing_after="40",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run(
             "\u2122 \u00a9 \u00ae \u20ac \u00a3 \u00a5 \u00a7 \u00b6 "
             "\u2020 \u2021 \u2022 \u2026 \u2014 \u2013",
@@ -542,11 +724,11 @@ def generate_unicode_text():
     ))
 
     # Mathematical symbols
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("[Mathematical Symbols]", size=11, bold=True, color="333399"),
         spacing_after="40",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run(
             "\u2211 \u222b \u2202 \u221a \u221e \u2260 \u2264 \u2265 "
             "\u00b1 \u00d7 \u00f7 \u03b1 \u03b2 \u03b3 \u03b4 \u03c0 "
@@ -557,11 +739,11 @@ def generate_unicode_text():
     ))
 
     # Emoji and misc
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run("[Box Drawing and Misc]", size=11, bold=True, color="333399"),
         spacing_after="40",
     ))
-    paras.append(make_para(
+    add_para(buf, make_para(
         make_run(
             "\u250c\u2500\u2500\u2500\u2510  \u2500\u2500\u2500  "
             "\u2502   \u2502  \u2190 \u2191 \u2192 \u2193 "
@@ -571,7 +753,7 @@ def generate_unicode_text():
         spacing_after="200",
     ))
 
-    return wrap_document("\n".join(paras))
+    return wrap_document(buf)
 
 
 # ---------------------------------------------------------------------------
@@ -579,14 +761,38 @@ def generate_unicode_text():
 # ---------------------------------------------------------------------------
 
 def generate_large_document():
-    paras = []
+    return wrap_document(_iter_large_document())
+
+
+def _iter_large_document():
+    """Yield large_document paragraphs one at a time.
+
+    The ~400 rendered paragraphs used to be accumulated before being
+    wrapped; yielding them keeps only the paragraph currently being
+    deflated alive while write_docx streams the document. The closing
+    summary quotes the paragraph count, so tally while streaming.
+    """
+    n_paras = 0
+    for para in _large_document_paras():
+        n_paras += 1
+        yield para
+    yield make_para(
+        make_run(
+            f"This document contains {n_paras} paragraphs across 25 "
+            f"chapters with varied fonts, headings, lists, and formatting.",
+            size=10, color="888888",
+        ),
+        align="center",
+    )
+
 
-    paras.append(make_para(
+def _large_document_paras():
+    yield make_para(
         make_run("Large Document Stress Test", size=32, bold=True),
         align="center",
         spacing_after="400",
-    ))
-    paras.append(make_para(
+    )
+    yield make_para(
         make_run(
             "This document contains enough content to span at least 20 pages, "
             "mixing headings, body text, lists, and varied fonts to exercise "
@@ -594,7 +800,7 @@ def generate_large_document():
             size=10, color="666666",
         ),
         spacing_after="200",
-    ))
+    )
 
     fonts = [
         "Times New Roman", "Arial", "Courier New", "Georgia",
@@ -638,42 +844,47 @@ def generate_large_document():
         "dui mi, tincidunt quis, accumsan porttitor, facilisis luctus, "
         "metus. Phasellus ultrices nulla quis nibh. Quisque a lectus.",
     ]
+    # Escape the whole pool once so the chapter loop can hand the runs
+    # pre-escaped text instead of re-checking it per paragraph.
+    lorem_paragraphs = _esc_all(lorem_paragraphs)
 
     # Generate ~25 chapters to ensure 20+ pages
     for chapter in range(1, 26):
         font = fonts[chapter % len(fonts)]
 
         # Chapter heading (H1)
-        paras.append(make_para(
+        yield make_para(
             make_run(f"Chapter {chapter}: Section with {font}",
                      size=24, bold=True, font=font),
             style="Heading1",
             spacing_after="200",
-        ))
+        )
 
         # Subheading (H2)
-        paras.append(make_para(
+        yield make_para(
             make_run(f"Section {chapter}.1 -- Introduction",
                      size=18, bold=True, font=font),
             style="Heading2",
             spacing_after="120",
-        ))
+        )
 
         # Body paragraphs
-        for i in range(5):
-            idx = (chapter + i) % len(lorem_paragraphs)
-            paras.append(make_para(
-                make_run(lorem_paragraphs[idx], size=11, font=font),
+        yield from (
+            make_para(
+                make_run(lorem_paragraphs[(chapter + i) % len(lorem_paragraphs)],
+                         size=11, font=font, pre_escaped=True),
                 spacing_after="120",
-            ))
+            )
+            for i in range(5)
+        )
 
         # Subheading (H2)
-        paras.append(make_para(
+        yield make_para(
             make_run(f"Section {chapter}.2 -- Key Points",
                      size=18, bold=True, font=font),
             style="Heading2",
             spacing_after="120",
-        ))
+        )
 
         # Bullet list
         items = [
@@ -681,31 +892,33 @@ def generate_large_document():
             + lorem_paragraphs[(chapter + j) % len(lorem_paragraphs)][:80]
             for j in range(1, 5)
         ]
-        for item in items:
-            paras.append(make_para(
+        yield from (
+            make_para(
                 make_run(f"\u2022 {item}", size=11, font=font),
                 indent_left="720",
                 spacing_after="40",
-            ))
+            )
+            for item in items
+        )
 
         # Another body paragraph
-        paras.append(make_para(
+        yield make_para(
             make_run(
                 lorem_paragraphs[(chapter * 2) % len(lorem_paragraphs)],
-                size=11, font=font,
+                size=11, font=font, pre_escaped=True,
             ),
             spacing_after="200",
-        ))
+        )
 
         # Subheading (H3)
-        paras.append(make_para(
+        yield make_para(
             make_run(f"Section {chapter}.3 -- Summary",
                      size=14, bold=True, italic=True, font=font),
             style="Heading3",
             spacing_after="80",
-        ))
+        )
 
-        paras.append(make_para(
+        yield make_para(
             make_run(
                 f"This concludes chapter {chapter}. The next chapter will "
                 f"continue with additional content in a different font to "
@@ -713,30 +926,27 @@ def generate_large_document():
                 size=11, font=font, italic=True, color="555555",
             ),
             spacing_after="300",
-        ))
+        )
 
     # Final page
-    paras.append(make_para(
+    yield make_para(
         make_run("--- End of Document ---", size=16, bold=True),
         align="center",
         spacing_after="200",
-    ))
-    paras.append(make_para(
-        make_run(
-            f"This document contains {len(paras)} paragraphs across 25 "
-            f"chapters with varied fonts, headings, lists, and formatting.",
-            size=10, color="888888",
-        ),
-        align="center",
-    ))
-
-    return wrap_document("\n".join(paras))
+    )
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
+def _build_one(fixtures_dir, filename, gen_func, include_numbering):
+    """Generate and write a single fixture (runs in a worker process)."""
+    path = os.path.join(fixtures_dir, filename)
+    size = write_docx(path, gen_func(), include_numbering=include_numbering)
+    return filename, size
+
+
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     fixtures_dir = os.path.join(script_dir, "fixtures")
@@ -751,10 +961,19 @@ def main():
     ]
 
     print(f"Generating test DOCX files in {fixtures_dir}/")
-    for filename, gen_func, needs_numbering in generators:
-        path = os.path.join(fixtures_dir, filename)
-        doc_xml = gen_func()
-        write_docx(path, doc_xml, include_numbering=needs_numbering)
+    # The five generators are independent and CPU-bound (string building
+    # plus deflate), so build them in parallel; the four small fixtures
+    # overlap with large_document.docx instead of waiting behind it.
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(len(generators), os.cpu_count() or 1)) as ex:
+        futures = {
+            ex.submit(_build_one, fixtures_dir, filename, gen_func, nm):
+                filename
+            for filename, gen_func, nm in generators
+        }
+        for future in concurrent.futures.as_completed(futures):
+            filename, size = future.result()
+            print(f"  Created {filename} ({size:,} bytes)")
 
     print("Done.")
 